@@ -16,7 +16,6 @@
 
 import ast
 from pathlib import Path
-import re
 import sys
 
 
@@ -27,10 +26,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent.absolute()))
 
 
 def read_version(base_module):
-    version_pattern = r'__version__\s+=\s+(.*)'
     init_path = Path(Path(__file__).parent.parent, base_module, '__init__.py')
-    repr_value = re.search(version_pattern, init_path.read_text()).group(1)
-    return ast.literal_eval(repr_value)
+    for line in init_path.read_text().splitlines():
+        if line.startswith('__version__'):
+            repr_value = line.split('=', 1)[1].strip()
+            return ast.literal_eval(repr_value)
+
+    raise RuntimeError(f'{base_module} version not found')
 
 
 project = 'Guesslang'
@@ -1,16 +1,17 @@
 """Guess the programming language of a given source code"""
 
-from argparse import ArgumentParser, FileType
-from copy import deepcopy
+from argparse import ArgumentParser
 import logging.config
 import sys
-from typing import Any, TextIO, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from guesslang.guess import Guess, GuesslangError
-from guesslang.model import DATASET
+from guesslang.model import DATASET, HyperParameter
 
 
 LOGGER = logging.getLogger(__name__)
+STDIN_FILENAME = '-'
+UNREADABLE_RESULT = 'Cannot read the source code file'
 LOGGING_CONFIG = {
     'version': 1,
     'formatters': {
@@ -75,22 +76,24 @@ def main() -> None:
             print(f'Trained model accuracy is {accuracy:.2%}')
 
         else:
-            # Guess source code language
-            LOGGER.debug(f'Guess the source code of: {args.filename}')
-            content = _read_file(args.filename)
-            if args.probabilities:
-                # List all the detection probabilities
-                scores = guess.probabilities(content)
-                texts = (f' {name:20} {score:6.2%}' for name, score in scores)
-                table = '\n'.join(texts)
-                print(f'Language name       Probability\n{table}')
-            else:
-                # Print the source code programming language name
-                # if it is successfully detected
-                language_name = guess.language_name(content)
-                if not language_name:
-                    language_name = 'Unknown'
-                print(f'Programming language: {language_name}')
+            # Guess source code language.
+            # The files are read and classified one batch at a time
+            filenames = args.filenames or [STDIN_FILENAME]
+            show_filename = len(filenames) > 1
+            nb_unreadable = 0
+            for pos in range(0, len(filenames), HyperParameter.BATCH_SIZE):
+                batch = filenames[pos:pos + HyperParameter.BATCH_SIZE]
+                LOGGER.debug(f'Guess the source code of: {batch}')
+                contents = [_read_file(filename) for filename in batch]
+                nb_unreadable += contents.count(None)
+                results = _guess_batch(guess, contents, args.probabilities)
+                for filename, result in zip(batch, results):
+                    if show_filename:
+                        print(f'{filename}:')
+                    print(result)
+
+            if nb_unreadable:
+                raise GuesslangError(f'{nb_unreadable} file(s) not read')
 
         LOGGER.debug('Exit OK')
 
@@ -106,13 +109,13 @@ def main() -> None:
 def _build_argument_parser() -> ArgumentParser:
     parser = ArgumentParser(description=__doc__)
     parser.add_argument(
-        'filename',
-        type=FileType('r'),
-        default=sys.stdin,
-        nargs='?',
-        help="""
-            source code file.
+        'filenames',
+        metavar='filename',
+        nargs='*',
+        help=f"""
+            source code files.
             Reads from the standard input (stdin) if no file is given
+            or if the file name is {STDIN_FILENAME}
         """,
     )
     parser.add_argument(
@@ -168,21 +171,71 @@ def _build_argument_parser() -> ArgumentParser:
 
 
 def _update_config(config: Dict[str, Any], level: int) -> Dict[str, Any]:
-    logging_config = deepcopy(config)
-    logging_config['root']['level'] = level
-    logging_config['loggers']['guesslang']['level'] = level
-    return logging_config
+    loggers = config['loggers']
+    return {
+        **config,
+        'root': {**config['root'], 'level': level},
+        'loggers': {
+            **loggers,
+            'guesslang': {**loggers['guesslang'], 'level': level},
+        },
+    }
+
+
+def _guess_batch(
+    guess: Guess,
+    contents: List[Optional[str]],
+    probabilities: bool,
+) -> List[str]:
+    # Unreadable files are skipped, the other files are still guessed
+    results = [UNREADABLE_RESULT] * len(contents)
+    positions = [
+        pos for pos, content in enumerate(contents) if content is not None
+    ]
+    readable_contents = [
+        content for content in contents if content is not None
+    ]
+    if not readable_contents:
+        return results
+
+    if probabilities:
+        # List all the detection probabilities
+        texts = [
+            _format_probabilities(scores)
+            for scores in guess.probabilities_batch(readable_contents)
+        ]
+    else:
+        # Print the source code programming language name
+        # if it is successfully detected
+        texts = [
+            f'Programming language: {language_name or "Unknown"}'
+            for language_name in guess.language_name_batch(readable_contents)
+        ]
 
+    for pos, text in zip(positions, texts):
+        results[pos] = text
 
-def _read_file(input_file: TextIO) -> str:
-    if input_file is sys.stdin:
-        LOGGER.debug('Write your source code here. End with CTR^D')
-        content = input_file.read()
-    else:
-        content = input_file.read()
-        input_file.close()
+    return results
+
+
+def _format_probabilities(scores: List[Tuple[str, float]]) -> str:
+    texts = (f' {name:20} {score:6.2%}' for name, score in scores)
+    table = '\n'.join(texts)
+    return f'Language name       Probability\n{table}'
+
+
+def _read_file(filename: str) -> Optional[str]:
+    try:
+        if filename == STDIN_FILENAME:
+            LOGGER.debug('Write your source code here. End with CTR^D')
+            return sys.stdin.read()
+
+        with open(filename) as input_file:
+            return input_file.read()
 
-    return content
+    except (OSError, UnicodeDecodeError) as error:
+        LOGGER.error(f'Cannot read {filename}: {error}')
+        return None
 
 
 if __name__ == '__main__':
@@ -1,11 +1,13 @@
 """Guesslang machine learning model"""
 
+from functools import lru_cache
 import json
 import logging
+from math import fsum, sqrt
 from pathlib import Path
-from statistics import mean, stdev
 from tempfile import TemporaryDirectory
-from typing import List, Tuple, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Optional
 
 from guesslang import model
 
@@ -35,8 +37,7 @@ class Guess:
         except OSError:
             self._model = None
 
-        language_json = LANGUAGES_FILE.read_text()
-        self._language_map = json.loads(language_json)
+        self._language_map = _load_language_map()
         self._extension_map = {
             ext: name for name, ext in self._language_map.items()
         }
@@ -65,18 +66,42 @@ class Guess:
         :return: the language name
             or ``None`` if no programming language is detected.
         """
-        if not source_code.strip():
-            LOGGER.warning('Empty source code provided')
-            return None
+        return self.language_name_batch([source_code])[0]
 
-        language_probabilities = self.probabilities(source_code)
-        probabilities = [value for _, value in language_probabilities]
-        if not self._is_reliable(probabilities):
-            LOGGER.warning('No programming language detected')
-            return None
+    def language_name_batch(
+        self,
+        source_codes: List[str],
+    ) -> List[Optional[str]]:
+        """Predict the programming language names of several source codes
+        at once, see :meth:`language_name`.
 
-        language_name, _ = language_probabilities[0]
-        return language_name
+        :param source_codes: list of source codes.
+        :return: for each source code, in the same order, the language name
+            or ``None`` if no programming language is detected.
+        """
+        language_names: List[Optional[str]] = [None] * len(source_codes)
+        positions = []
+        for pos, source_code in enumerate(source_codes):
+            if source_code.strip():
+                positions.append(pos)
+            else:
+                LOGGER.warning('Empty source code provided')
+
+        if not positions:
+            return language_names
+
+        contents = [source_codes[pos] for pos in positions]
+        results = self.probabilities_batch(contents)
+        for pos, language_probabilities in zip(positions, results):
+            probabilities = [value for _, value in language_probabilities]
+            if not self._is_reliable(probabilities):
+                LOGGER.warning('No programming language detected')
+                continue
+
+            language_name, _ = language_probabilities[0]
+            language_names[pos] = language_name
+
+        return language_names
 
     def probabilities(self, source_code: str) -> List[Tuple[str, float]]:
         """Gives the probability that the source code is written
@@ -88,6 +113,22 @@ class Guess:
         :param source_code: source code.
         :return: list of language names associated with their probability.
         """
+        return self.probabilities_batch([source_code])[0]
+
+    def probabilities_batch(
+        self,
+        source_codes: List[str],
+    ) -> List[List[Tuple[str, float]]]:
+        """Gives the language probabilities of several source codes at once.
+
+        The source codes are sent to the machine learning model in batches,
+        which is much faster than calling :meth:`probabilities`
+        for each of them.
+
+        :param source_codes: list of source codes.
+        :return: for each source code, in the same order,
+            the list of language names associated with their probability.
+        """
         if not self.is_trained:
             LOGGER.error('Cannot predict using an untrained model')
             raise GuesslangError(
@@ -96,7 +137,9 @@ class Guess:
                 f'Train your model with `guess.train(source_files_dir)`'
             )
 
-        return model.predict(self._model, self._extension_map, source_code)
+        return model.predict_batch(
+            self._model, self._extension_map, source_codes
+        )
 
     def train(self, source_files_dir: str, max_steps: int) -> float:
         """Train guesslang to recognize programming languages.
@@ -160,10 +203,24 @@ class Guess:
         The predicted language probability must be higher than
         2 standard deviations from the mean.
         """
-        threshold = mean(probabilities) + 2*stdev(probabilities)
+        count = len(probabilities)
+        mean = fsum(probabilities) / count
+        deviations = fsum((value - mean)**2 for value in probabilities)
+        stdev = sqrt(deviations / (count - 1))
+        threshold = mean + 2*stdev
         predicted_language_probability = max(probabilities)
         return predicted_language_probability > threshold
 
 
+@lru_cache(maxsize=None)
+def _load_language_map() -> Mapping[str, str]:
+    """Read the supported languages file only once per process.
+    The cached mapping is shared, so it is returned read-only.
+    """
+    language_json = LANGUAGES_FILE.read_text()
+    language_map: Dict[str, str] = json.loads(language_json)
+    return MappingProxyType(language_map)
+
+
 class GuesslangError(Exception):
     """Guesslang exception class"""
@@ -1,8 +1,6 @@
 """Machine learning model"""
 
-from copy import deepcopy
 import logging
-from operator import itemgetter
 from pathlib import Path
 import shutil
 from tempfile import TemporaryDirectory
@@ -117,43 +115,48 @@ def test(
     mapping: Dict[str, str],
 ) -> Dict[str, Dict[str, int]]:
     """Test a Tensorflow saved model"""
-    values = {language: 0 for language in mapping.values()}
-    matches = {language: deepcopy(values) for language in values}
+    languages = mapping.values()
+    matches = {language: dict.fromkeys(languages, 0) for language in languages}
 
     LOGGER.debug('Test the model')
+    predict_function = saved_model.signatures['predict']
     input_function = _build_input_fn(data_root_dir, ModeKeys.PREDICT)
-    for test_item in input_function():
-        content = test_item[0]
-        label = test_item[1].numpy()[0].decode()
+    for contents, labels in input_function():
+        result = predict_function(contents)
+        predictions = result['classes'].numpy()[:, 0]
 
-        result = saved_model.signatures['predict'](content)
-        predicted = result['classes'].numpy()[0][0].decode()
-
-        label_language = mapping[label]
-        predicted_language = mapping[predicted]
-        matches[label_language][predicted_language] += 1
+        for label, predicted in zip(labels.numpy(), predictions):
+            label_language = mapping[label.decode()]
+            predicted_language = mapping[predicted.decode()]
+            matches[label_language][predicted_language] += 1
 
     return matches
 
 
-def predict(
+def predict_batch(
     saved_model: AutoTrackable,
     mapping: Dict[str, str],
-    text: str
-) -> List[Tuple[str, float]]:
-    """Infer a Tensorflow saved model"""
-    content_tensor = tf.constant([text])
-    predicted = saved_model.signatures['serving_default'](content_tensor)
-
-    numpy_floats = predicted['scores'][0].numpy()
-    extensions = predicted['classes'][0].numpy()
-
-    probability_values = (float(value) for value in numpy_floats)
-    languages = (mapping[ext.decode()] for ext in extensions)
-
-    unsorted_scores = zip(languages, probability_values)
-    scores = sorted(unsorted_scores, key=itemgetter(1), reverse=True)
-    return scores
+    texts: List[str]
+) -> List[List[Tuple[str, float]]]:
+    """Infer a Tensorflow saved model on several texts at once"""
+    serving_function = saved_model.signatures['serving_default']
+    results = []
+    for pos in range(0, len(texts), HyperParameter.BATCH_SIZE):
+        batch = texts[pos:pos + HyperParameter.BATCH_SIZE]
+        content_tensor = tf.constant(batch)
+        predicted = serving_function(content_tensor)
+
+        batch_floats = predicted['scores'].numpy()
+        batch_extensions = predicted['classes'].numpy()
+        for numpy_floats, extensions in zip(batch_floats, batch_extensions):
+            order = (-numpy_floats).argsort(kind='stable')
+            scores = [
+                (mapping[extensions[rank].decode()], float(numpy_floats[rank]))
+                for rank in order
+            ]
+            results.append(scores)
+
+    return results
 
 
 def _build_input_fn(
@@ -164,16 +167,24 @@ def _build_input_fn(
     pattern = str(Path(data_root_dir).joinpath(DATASET[mode], '*'))
 
     def input_function() -> tf.data.Dataset:
-        dataset = tf.data.Dataset
-        dataset = dataset.list_files(pattern, shuffle=True).map(_read_file)
+        # The files are shuffled, parallel steps don't need to keep order
+        options = tf.data.Options()
+        options.experimental_deterministic = False
+
+        dataset = tf.data.Dataset.list_files(pattern, shuffle=True)
+        dataset = dataset.with_options(options)
+        dataset = dataset.map(_read_file, num_parallel_calls=tf.data.AUTOTUNE)
 
         if mode == ModeKeys.PREDICT:
-            return dataset.batch(1)
+            dataset = dataset.batch(HyperParameter.BATCH_SIZE)
+            return dataset.prefetch(1)
 
         if mode == ModeKeys.TRAIN:
             dataset = dataset.shuffle(Training.SHUFFLE_BUFFER).repeat()
 
-        return dataset.map(_preprocess).batch(HyperParameter.BATCH_SIZE)
+        dataset = dataset.batch(HyperParameter.BATCH_SIZE)
+        dataset = dataset.map(_preprocess, num_parallel_calls=tf.data.AUTOTUNE)
+        return dataset.prefetch(tf.data.AUTOTUNE)
 
     return input_function
 
@@ -183,7 +194,7 @@ def _serving_input_receiver_fn() -> tf.estimator.export.ServingInputReceiver:
 
     content = tf.compat.v1.placeholder(tf.string, [None])
     receiver_tensors = {'content': content}
-    features = {'content': tf.map_fn(_preprocess_text, content)}
+    features = {'content': _preprocess_text(content)}
 
     return tf.estimator.export.ServingInputReceiver(
         receiver_tensors=receiver_tensors,
@@ -202,16 +213,17 @@ def _preprocess(
     data: tf.Tensor,
     label: tf.Tensor,
 ) -> Tuple[Dict[str, tf.Tensor], tf.Tensor]:
-    """Process input data as part of a workflow"""
+    """Process a batch of input data as part of a workflow"""
     data = _preprocess_text(data)
     return {'content': data}, label
 
 
 def _preprocess_text(data: tf.Tensor) -> tf.Tensor:
-    """Feature engineering"""
-    padding = tf.constant(['']*HyperParameter.NB_TOKENS)
+    """Feature engineering, on a batch of texts"""
+    # Only the first NB_TOKENS n-grams are used, don't split the rest
+    max_length = HyperParameter.NB_TOKENS + HyperParameter.N_GRAM - 1
+    data = tf.strings.substr(data, 0, max_length)
     data = tf.strings.bytes_split(data)
     data = tf.strings.ngrams(data, HyperParameter.N_GRAM)
-    data = tf.concat((data, padding), axis=0)
-    data = data[:HyperParameter.NB_TOKENS]
-    return data
+    shape = [None, HyperParameter.NB_TOKENS]
+    return data.to_tensor(default_value='', shape=shape)
@@ -27,6 +27,20 @@ if __name__ == "__main__":
 PLAIN_TEXT = 'The quick brown fox jumps over the lazy dog'
 
 
+@pytest.fixture(name='guess', scope='module')
+def fixture_guess():
+    """Default Guess instance, the model is loaded once per module"""
+    return Guess()
+
+
+@pytest.fixture(name='source_files_dir', scope='module')
+def fixture_source_files_dir(tmp_path_factory):
+    """Training dataset, only read by the tests"""
+    source_files_dir = tmp_path_factory.mktemp('source_files')
+    _create_training_files(source_files_dir)
+    return str(source_files_dir)
+
+
 def test_guess_init():
     guess = Guess()
     assert guess.is_trained
@@ -38,25 +52,34 @@ def test_guess_init_with_model_dir():
         assert not guess.is_trained
 
 
-def test_guess_supported_languages():
-    guess = Guess()
+def test_guess_supported_languages(guess):
     assert len(guess.supported_languages) >= 30
     assert 'Python' in guess.supported_languages
     assert 'C' in guess.supported_languages
 
 
-def test_guess_language_name():
-    guess = Guess()
+def test_guess_language_name(guess):
     assert guess.language_name(PYTHON_CODE) == 'Python'
     assert guess.language_name(C_CODE) == 'C'
 
 
-def test_guess_language_name_empty_code():
-    guess = Guess()
+def test_guess_language_name_empty_code(guess):
     assert guess.language_name('') is None
     assert guess.language_name(' \t \n ') is None
 
 
+def test_guess_language_name_batch(guess):
+    source_codes = [PYTHON_CODE, '', C_CODE, ' \t \n ']
+    names = guess.language_name_batch(source_codes)
+    assert names == ['Python', None, 'C', None]
+
+
+def test_guess_language_name_batch_empty_code_untrained_model():
+    with tempfile.TemporaryDirectory() as model_dir:
+        guess = Guess(model_dir)
+        assert guess.language_name_batch(['', ' \n ']) == [None, None]
+
+
 def test_guess_language_name_untrained_model():
     with tempfile.TemporaryDirectory() as model_dir:
         guess = Guess(model_dir)
@@ -67,13 +90,11 @@ def test_guess_language_name_untrained_model():
 
 
 @pytest.mark.skip(reason='The plain text is detected as Markdown')
-def test_guess_language_name_plain_text():
-    guess = Guess()
+def test_guess_language_name_plain_text(guess):
     assert guess.language_name(PLAIN_TEXT) is None
 
 
-def test_guess_probabilities():
-    guess = Guess()
+def test_guess_probabilities(guess):
     scores = guess.probabilities(PYTHON_CODE)
     assert len(scores) == len(guess.supported_languages)
 
@@ -85,13 +106,33 @@ def test_guess_probabilities():
     assert top_language == 'Python'
 
 
-def test_guess_train_with_default_model():
-    guess = Guess()
-    with tempfile.TemporaryDirectory() as source_files_dir:
-        _create_training_files(source_files_dir)
+def test_guess_probabilities_batch(guess):
+    source_codes = [PYTHON_CODE, C_CODE, PYTHON_CODE]
+    results = guess.probabilities_batch(source_codes)
+    assert len(results) == len(source_codes)
+
+    for scores in results:
+        assert len(scores) == len(guess.supported_languages)
+
+    top_languages = [scores[0][0] for scores in results]
+    assert top_languages == ['Python', 'C', 'Python']
+
+
+def test_guess_probabilities_batch_empty_list(guess):
+    assert guess.probabilities_batch([]) == []
+
+
+def test_guess_probabilities_batch_untrained_model():
+    with tempfile.TemporaryDirectory() as model_dir:
+        guess = Guess(model_dir)
 
         with pytest.raises(GuesslangError):
-            guess.train(source_files_dir, max_steps=10)
+            guess.probabilities_batch([C_CODE])
+
+
+def test_guess_train_with_default_model(guess, source_files_dir):
+    with pytest.raises(GuesslangError):
+        guess.train(source_files_dir, max_steps=10)
 
 
 def test_guess_train_without_subdirectories():
@@ -103,12 +144,10 @@ def test_guess_train_without_subdirectories():
                 guess.train(source_files_dir, max_steps=10)
 
 
-def test_guess_train():
+def test_guess_train(source_files_dir):
     with tempfile.TemporaryDirectory() as model_dir:
         guess = Guess(model_dir)
-        with tempfile.TemporaryDirectory() as source_files_dir:
-            _create_training_files(source_files_dir)
-            guess.train(source_files_dir, max_steps=10)
+        guess.train(source_files_dir, max_steps=10)
 
         assert guess.language_name(PYTHON_CODE) == 'Python'
         assert guess.language_name(C_CODE) == 'C'
@@ -0,0 +1,66 @@
+import logging.config
+import sys
+
+import pytest
+
+from guesslang.__main__ import UNREADABLE_RESULT, main
+
+
+PYTHON_CODE = """
+from __future__ import print_function
+
+
+if __name__ == "__main__":
+    print("Hello world")
+"""
+
+
+@pytest.fixture(name='keep_logging_config', autouse=True)
+def fixture_keep_logging_config(monkeypatch):
+    # Logging handlers would outlive the streams captured by capsys
+    monkeypatch.setattr(logging.config, 'dictConfig', lambda config: None)
+
+
+def test_main_one_file(monkeypatch, capsys, tmp_path):
+    python_path = tmp_path.joinpath('code.py')
+    python_path.write_text(PYTHON_CODE)
+
+    monkeypatch.setattr(sys, 'argv', ['guesslang', str(python_path)])
+    main()
+
+    assert 'Programming language: Python\n' in capsys.readouterr().out
+
+
+def test_main_several_files(monkeypatch, capsys, tmp_path):
+    python_path = tmp_path.joinpath('code.py')
+    python_path.write_text(PYTHON_CODE)
+    empty_path = tmp_path.joinpath('empty.txt')
+    empty_path.write_text('')
+
+    argv = ['guesslang', str(python_path), str(empty_path)]
+    monkeypatch.setattr(sys, 'argv', argv)
+    main()
+
+    output = capsys.readouterr().out
+    python_result = f'{python_path}:\nProgramming language: Python\n'
+    empty_result = f'{empty_path}:\nProgramming language: Unknown\n'
+    assert python_result in output
+    assert empty_result in output
+    assert output.index(python_result) < output.index(empty_result)
+
+
+def test_main_unreadable_file(monkeypatch, capsys, tmp_path):
+    binary_path = tmp_path.joinpath('binary.dat')
+    binary_path.write_bytes(b'\xff\xfe\x00\x80')
+    python_path = tmp_path.joinpath('code.py')
+    python_path.write_text(PYTHON_CODE)
+
+    argv = ['guesslang', str(binary_path), str(python_path)]
+    monkeypatch.setattr(sys, 'argv', argv)
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 1
+    output = capsys.readouterr().out
+    assert f'{binary_path}:\n{UNREADABLE_RESULT}\n' in output
+    assert f'{python_path}:\nProgramming language: Python\n' in output
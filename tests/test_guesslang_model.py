@@ -0,0 +1,44 @@
+import tensorflow as tf
+
+from guesslang.model import HyperParameter, _preprocess_text
+
+
+C_CODE = """
+#include <stdio.h>
+
+int main(int argc, char* argv[])
+{
+  printf("Hello world");
+}
+"""
+
+TEXTS = [
+    '',
+    'x',
+    'Ça dépend: λ → ∞ ✓',
+    C_CODE * 200,
+]
+
+
+def test_preprocess_text_shape():
+    features = _preprocess_text(tf.constant(TEXTS))
+    assert features.shape == (len(TEXTS), HyperParameter.NB_TOKENS)
+
+
+def test_preprocess_text_same_as_per_example_features():
+    assert len(TEXTS[-1].encode()) > HyperParameter.NB_TOKENS + 1
+
+    features = _preprocess_text(tf.constant(TEXTS)).numpy()
+    for text, text_features in zip(TEXTS, features):
+        expected = _per_example_preprocess_text(tf.constant(text)).numpy()
+        assert text_features.tolist() == expected.tolist()
+
+
+def _per_example_preprocess_text(data):
+    """Reference feature engineering, applied to a single text"""
+    padding = tf.constant(['']*HyperParameter.NB_TOKENS)
+    data = tf.strings.bytes_split(data)
+    data = tf.strings.ngrams(data, HyperParameter.N_GRAM)
+    data = tf.concat((data, padding), axis=0)
+    data = data[:HyperParameter.NB_TOKENS]
+    return data